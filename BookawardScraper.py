@@ -1,106 +1,292 @@
-import json
 import os
+import re
+import sys
+import mmap
+import hashlib
+import tempfile
 import requests
 import argparse
-from typing import List, Dict
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Tuple
 from dotenv import load_dotenv
-from rich.console import Console
 
 # Load environment variables
 load_dotenv()
 
+# Number of Perplexity requests kept in flight at the same time
+DEFAULT_CONCURRENCY = 8
+# JSON Lines file receiving each enriched award as soon as it completes
+PARTIAL_RESULTS_FILE = 'bookawards_result_partial.jsonl'
+# Directory holding cached Perplexity responses keyed by model + prompt hash
+CACHE_DIR = 'cache'
+# Files at least this large are parsed straight from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+# Body of a ```json fenced block and the outermost JSON object in a response
+_CODE_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL)
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+# Prompt sent for every award; only {award_name} is filled in per request
+_PROMPT_TEMPLATE = (
+    "Create a structured JSON object for the {award_name} literary award, including the following details:\n"
+    "Registration URL: The web address where participants can register for the award.\n"
+    "Categories: A list of categories under which books can compete.\n"
+    "Organization: The organization responsible for hosting the award.\n"
+    "Last Winning Books for the {award_name} literary award: An array of the winning books the last years, with each entry containing:\n"
+    "  - Author\n"
+    "  - Title\n"
+    "  - Publishing Year\n"
+    "  - Publisher\n"
+    "  - ISBN\n"
+    "  - Link to the book\n"
+    "Latest Date of Submission: The deadline for submitting entries for this year's award.\n"
+    "Possible Strongest Competition This Year: A list of books or authors likely to be strong contenders in this year's competition.\n\n"
+    "Ensure that the JSON is formatted as follows:\n"
+    "{{\n"
+    "  \"bookAward\": {{\n"
+    "    \"registrationUrl\": \"https://example.com/register\",\n"
+    "    \"categories\": [\"Fiction\", \"Non-Fiction\", \"Poetry\", \"Young Adult\"],\n"
+    "    \"organization\": \"National Book Foundation\",\n"
+    "    \"lastWinningBooks\": [\n"
+    "      {{\n"
+    "        \"author\": \"John Doe\",\n"
+    "        \"title\": \"The Great Novel\",\n"
+    "        \"publishingYear\": 2024,\n"
+    "        \"publisher\": \"Fictional Press\",\n"
+    "        \"isbn\": \"123-4567890123\",\n"
+    "        \"link\": \"https://example.com/the-great-novel\"\n"
+    "      }},\n"
+    "      {{\n"
+    "        \"author\": \"Jane Smith\",\n"
+    "        \"title\": \"Poems of the Heart\",\n"
+    "        \"publishingYear\": 2024,\n"
+    "        \"publisher\": \"Poetry House\",\n"
+    "        \"isbn\": \"987-6543210987\",\n"
+    "        \"link\": \"https://example.com/poems-of-the-heart\"\n"
+    "      }}\n"
+    "    ],\n"
+    "    \"latestDateOfSubmission\": \"2025-04-30\",\n"
+    "    \"possibleStrongestCompetitionThisYear\": [\n"
+    "      {{\n"
+    "        \"author\": \"Alice Johnson\",\n"
+    "        \"title\": \"A New Dawn\"\n"
+    "      }},\n"
+    "      {{\n"
+    "        \"author\": \"Bob Brown\",\n"
+    "        \"title\": \"The Last Frontier\"\n"
+    "      }}\n"
+    "    ]\n"
+    "  }}\n"
+    "}}\n"
+    # "Use \"Not available\" for information that cannot be found, but make reasonable predictions based on past winners and trends for the competition section.\n"
+    "Please ensure to find finding the last winning books of the last year for this aw.\n"
+    "Response should be ONLY the valid JSON without any other text."
+)
+
+
+def read_json_file(path: str):
+    """Parse a JSON file, memory-mapping it when it is large."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buffer:
+                return orjson.loads(buffer)
+
+
+@dataclass(slots=True)
+class Award:
+    """A single book award entry as stored in the awards JSON files."""
+    award_name: str
+    registration_url: str = ''
+    categories: List[str] = field(default_factory=list)
+    organization: str = ''
+    enriched_data: Optional[Dict] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Award':
+        """Build an award from a JSON entry, dropping keys that are not Award fields."""
+        if not isinstance(data, dict):
+            raise TypeError(f"award entry must be an object, not {type(data).__name__}")
+        unknown = data.keys() - _AWARD_FIELDS
+        if unknown:
+            print(f"Warning: ignoring unknown fields {', '.join(sorted(unknown))} "
+                  f"in award {data.get('award_name', '<unnamed>')!r}")
+            data = {key: value for key, value in data.items() if key in _AWARD_FIELDS}
+        return cls(**data)
+
+    def to_dict(self) -> Dict:
+        """Return the award as a dict, omitting enriched_data when it is unset."""
+        data = {
+            'award_name': self.award_name,
+            'registration_url': self.registration_url,
+            'categories': self.categories,
+            'organization': self.organization
+        }
+        if self.enriched_data is not None:
+            data['enriched_data'] = self.enriched_data
+        return data
+
+
+def dump_awards(awards, option: int = 0) -> bytes:
+    """Serialize awards with orjson, keeping the dict layout of the JSON files."""
+    return orjson.dumps(awards, default=Award.to_dict, option=option | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+def write_awards(f, awards: List[Award]):
+    """Write awards as an indented JSON array, serializing one award at a time.
+    
+    The output is identical to dump_awards(awards, option=orjson.OPT_INDENT_2)
+    without building the whole document in memory.
+    """
+    if not awards:
+        f.write(b'[]')
+        return
+    f.write(b'[\n')
+    for i, award in enumerate(awards):
+        if i:
+            f.write(b',\n')
+        # JSON strings never contain raw newlines, so this only shifts the layout
+        f.write(b'  ' + dump_awards(award, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+    f.write(b'\n]')
+
+
+def is_enriched(award: Award) -> bool:
+    """Return True if the award holds a successful Perplexity result."""
+    return isinstance(award.enriched_data, dict) and 'registrationUrl' in award.enriched_data
+
+
+# Keys Award.from_dict accepts
+_AWARD_FIELDS = frozenset(f.name for f in fields(Award))
+
+
 class BookawardScraper:
-    def __init__(self, json_file: str = 'bookawards_merged.json'):
+    def __init__(self, json_file: str = 'bookawards_merged.json', use_cache: bool = True,
+                 cache_dir: str = CACHE_DIR):
         self.json_file = json_file
         self.awards = []
-        self.console = Console()
+        self._by_name_lower: Dict[str, Award] = {}
+        self._by_org_lower: Dict[str, List[Award]] = {}
+        self._by_category: Dict[str, List[Award]] = {}
+        self._all_categories_sorted: Tuple[str, ...] = ()
         self.perplexity_url = "https://api.perplexity.ai/chat/completions"
+        self.payload_model = "sonar"
         self.api_key = os.environ.get('PERPLEXITY_API_KEY')
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self._session = self._create_session(DEFAULT_CONCURRENCY)
+
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """Create a keep-alive session that retries rate limits and server errors.
+        
+        pool_size should be at least the number of concurrent requests, or
+        urllib3 discards the extra connections instead of keeping them alive.
+        """
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        # read=False re-raises read timeouts instead of resending a paid request
+        # the server may already have handled; requests then reports them as
+        # Timeout. Rate limits and server errors are still retried.
+        retry = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['POST']),
+            raise_on_status=False
+        )
+        # All requests go to the one Perplexity host, so a single pool suffices
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        session.mount('https://', adapter)
+        self._pool_size = pool_size
+        return session
 
-    def load_awards(self) -> List[Dict]:
+    def load_awards(self) -> List[Award]:
         """Load and parse the bookawards JSON file."""
         try:
-            with open(self.json_file, 'r') as f:
-                self.awards = json.load(f)
+            self.awards = [Award.from_dict(award) for award in read_json_file(self.json_file)]
+            self._build_indices()
             return self.awards
         except FileNotFoundError:
             print(f"Error: {self.json_file} not found")
             return []
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print(f"Error: {self.json_file} contains invalid JSON")
             return []
+        except TypeError as e:
+            print(f"Error: {self.json_file} contains an invalid award entry: {str(e)}")
+            return []
 
-        """
-        Enrich the bookawards data with additional information from Perplexity.
-        
-        Returns a new list of enriched award dictionaries.
-        """
-    def get_award_info_from_perplexity(self, award: Dict) -> Dict:
+    def _build_indices(self):
+        """Index awards by lowercased name, lowercased organization and category."""
+        self._by_name_lower = {}
+        self._by_org_lower = {}
+        self._by_category = {}
+        for award in self.awards:
+            self._by_name_lower.setdefault(award.award_name.lower(), award)
+            self._by_org_lower.setdefault(award.organization.lower(), []).append(award)
+            for category in dict.fromkeys(award.categories):
+                self._by_category.setdefault(category, []).append(award)
+        self._all_categories_sorted = tuple(sorted(self._by_category))
+
+    def _cache_key(self, prompt: str) -> str:
+        """Return the cache key for a prompt sent to the configured model."""
+        return hashlib.sha256((self.payload_model + prompt).encode()).hexdigest()
+
+    def _cache_path(self, prompt: str) -> str:
+        return os.path.join(self.cache_dir, f"{self._cache_key(prompt)}.json")
+
+    def _load_cached_response(self, prompt: str):
+        """Return the cached bookAward object for a prompt, or None on a miss."""
+        if not self.use_cache:
+            return None
+        path = self._cache_path(prompt)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _store_cached_response(self, prompt: str, book_award: Dict):
+        """Atomically write a parsed bookAward object to the response cache."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(book_award))
+            os.replace(tmp_path, self._cache_path(prompt))
+        except OSError as e:
+            print(f"Warning: Could not write response cache: {str(e)}")
+
+    def get_award_info_from_perplexity(self, award: Award) -> Award:
         """Get additional information about an award using Perplexity API."""
+        prompt = _PROMPT_TEMPLATE.format(award_name=award.award_name)
+
+        cached = self._load_cached_response(prompt)
+        if cached is not None:
+            award.enriched_data = cached
+            print(f"Using cached data for {award.award_name}")
+            return award
+
+        # The API key is only needed for responses that are not cached yet
         if not self.api_key:
             print("Error: PERPLEXITY_API_KEY not set in environment variables")
             return award
 
-        prompt = (
-            f"Create a structured JSON object for the {award['award_name']} literary award, including the following details:\n"
-            "Registration URL: The web address where participants can register for the award.\n"
-            "Categories: A list of categories under which books can compete.\n"
-            "Organization: The organization responsible for hosting the award.\n"
-            "Last Winning Books for the {award['award_name']} literary award: An array of the winning books the last years, with each entry containing:\n"
-            "  - Author\n"
-            "  - Title\n"
-            "  - Publishing Year\n"
-            "  - Publisher\n"
-            "  - ISBN\n"
-            "  - Link to the book\n"
-            "Latest Date of Submission: The deadline for submitting entries for this year's award.\n"
-            "Possible Strongest Competition This Year: A list of books or authors likely to be strong contenders in this year's competition.\n\n"
-            "Ensure that the JSON is formatted as follows:\n"
-            "{\n"
-            "  \"bookAward\": {\n"
-            "    \"registrationUrl\": \"https://example.com/register\",\n"
-            "    \"categories\": [\"Fiction\", \"Non-Fiction\", \"Poetry\", \"Young Adult\"],\n"
-            "    \"organization\": \"National Book Foundation\",\n"
-            "    \"lastWinningBooks\": [\n"
-            "      {\n"
-            "        \"author\": \"John Doe\",\n"
-            "        \"title\": \"The Great Novel\",\n"
-            "        \"publishingYear\": 2024,\n"
-            "        \"publisher\": \"Fictional Press\",\n"
-            "        \"isbn\": \"123-4567890123\",\n"
-            "        \"link\": \"https://example.com/the-great-novel\"\n"
-            "      },\n"
-            "      {\n"
-            "        \"author\": \"Jane Smith\",\n"
-            "        \"title\": \"Poems of the Heart\",\n"
-            "        \"publishingYear\": 2024,\n"
-            "        \"publisher\": \"Poetry House\",\n"
-            "        \"isbn\": \"987-6543210987\",\n"
-            "        \"link\": \"https://example.com/poems-of-the-heart\"\n"
-            "      }\n"
-            "    ],\n"
-            "    \"latestDateOfSubmission\": \"2025-04-30\",\n"
-            "    \"possibleStrongestCompetitionThisYear\": [\n"
-            "      {\n"
-            "        \"author\": \"Alice Johnson\",\n"
-            "        \"title\": \"A New Dawn\"\n"
-            "      },\n"
-            "      {\n"
-            "        \"author\": \"Bob Brown\",\n"
-            "        \"title\": \"The Last Frontier\"\n"
-            "      }\n"
-            "    ]\n"
-            "  }\n"
-            "}\n"
-            # "Use \"Not available\" for information that cannot be found, but make reasonable predictions based on past winners and trends for the competition section.\n"
-            "Please ensure to find finding the last winning books of the last year for this aw.\n"
-            "Response should be ONLY the valid JSON without any other text."
-        )
-
         payload = {
             "temperature": 0.1,  # Lower temperature for more consistent output
             "top_p": 0.9,
-            "model": "sonar",
+            "model": self.payload_model,
             "messages": [
                 {
                     "role": "user",
@@ -109,134 +295,172 @@ class BookawardScraper:
             ]
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
         try:
-            response = requests.post(self.perplexity_url, json=payload, headers=headers, timeout=30)
+            response = self._session.post(self.perplexity_url, json=payload, timeout=30)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if 'choices' in data and len(data['choices']) > 0:
                     content = data['choices'][0]['message']['content']
                     
                     # Try to extract JSON from the response if it's embedded in text
                     try:
-                        # Find JSON-like structure in the content
-                        json_start = content.find('{')
-                        json_end = content.rfind('}') + 1
-                        if json_start >= 0 and json_end > json_start:
-                            json_str = content[json_start:json_end]
-                            parsed_json = json.loads(json_str)
+                        # Prefer a fenced code block, then find the JSON object in it
+                        fence_match = _CODE_FENCE_RE.search(content)
+                        if fence_match:
+                            content = fence_match.group(1)
+                        json_match = _JSON_OBJ_RE.search(content)
+                        if json_match:
+                            parsed_json = orjson.loads(json_match.group(0))
                             
                             # Extract the bookAward object
                             if 'bookAward' in parsed_json:
                                 book_award = parsed_json['bookAward']
                                 # Store the enriched data in the award object
-                                award['enriched_data'] = book_award
-                                print(f"Successfully enriched data for {award['award_name']}")
+                                award.enriched_data = book_award
+                                self._store_cached_response(prompt, book_award)
+                                print(f"Successfully enriched data for {award.award_name}")
                             else:
-                                print(f"Warning: No 'bookAward' field in response for {award['award_name']}")
+                                print(f"Warning: No 'bookAward' field in response for {award.award_name}")
                         else:
-                            print(f"Warning: No JSON structure found in response for {award['award_name']}")
-                    except json.JSONDecodeError:
-                        print(f"Error: Could not parse JSON response for {award['award_name']}")
+                            print(f"Warning: No JSON structure found in response for {award.award_name}")
+                    except orjson.JSONDecodeError:
+                        print(f"Error: Could not parse JSON response for {award.award_name}")
                 else:
-                    print(f"Error: No choices in response for {award['award_name']}")
+                    print(f"Error: No choices in response for {award.award_name}")
             else:
-                print(f"Error: API request failed with status {response.status_code} for {award['award_name']}")
+                print(f"Error: API request failed with status {response.status_code} for {award.award_name}")
         except requests.exceptions.Timeout:
-            print(f"Error: Request timed out for {award['award_name']}")
+            print(f"Error: Request timed out for {award.award_name}")
         except Exception as e:
-            print(f"Error making API request for {award['award_name']}: {str(e)}")
+            print(f"Error making API request for {award.award_name}: {str(e)}")
 
         return award
 
-    def enrich_awards_with_perplexity(self, limit: int = None) -> List[Dict]:
+    def enrich_awards_with_perplexity(self, limit: int = None, concurrency: int = DEFAULT_CONCURRENCY) -> List[Award]:
         """Enrich awards with additional information from Perplexity.
         
+        Requests are issued concurrently so that network latency of one award
+        overlaps with the others. Awards are enriched in place, so the returned
+        list is self.awards in its original order.
+        
         Args:
             limit: Maximum number of awards to process (None for all)
+            concurrency: Maximum number of Perplexity requests in flight
         """
-        enriched_awards = []
-        
         # Limit to the specified number or use all awards
         awards_to_process = self.awards[:limit] if limit else self.awards
         total_awards = len(awards_to_process)
         
-        print(f"Processing {total_awards} awards out of {len(self.awards)} total")
+        print(f"Processing {total_awards} awards out of {len(self.awards)} total "
+              f"({concurrency} concurrent requests)")
 
+        pending = []
+        resumed = self._load_partial_results()
         for i, award in enumerate(awards_to_process, 1):
-            print(f"Processing award {i}/{total_awards}: {award['award_name']}")
+            # Only spend an API request on awards that still need one
+            if not award.award_name.strip():
+                print(f"Skipping award {i}: empty name")
+            elif is_enriched(award):
+                continue
+            elif award.award_name in resumed and is_enriched(resumed[award.award_name]):
+                award.enriched_data = resumed[award.award_name].enriched_data
+            else:
+                pending.append(award)
+        processed = total_awards - len(pending)
+        if processed:
+            print(f"Skipping {processed} awards that are already enriched or have no name")
+
+        concurrency = max(1, concurrency)
+        if concurrency > self._pool_size:
+            # Give every worker its own keep-alive connection
+            self._session.close()
+            self._session = self._create_session(concurrency)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        futures = {executor.submit(self.get_award_info_from_perplexity, award): award for award in pending}
+        with open(PARTIAL_RESULTS_FILE, 'ab') as partial_file:
             try:
-                enriched_award = self.get_award_info_from_perplexity(award.copy())
-                enriched_awards.append(enriched_award)
-                # Save progress after each successful enrichment
-                with open('bookawards_result_partial.json', 'w', encoding='utf-8') as f:
-                    json.dump(enriched_awards, f, indent=2, ensure_ascii=False)
-                print(f"Progress saved for {award['award_name']}")
+                for future in as_completed(futures):
+                    award = futures[future]
+                    processed += 1
+                    try:
+                        future.result()
+                        print(f"Processed award {processed}/{total_awards}: {award.award_name}")
+                    except Exception as e:
+                        print(f"Error processing {award.award_name}: {str(e)}")
+                        continue
+                    # Append each enriched award so an interrupted run can resume;
+                    # a failed request leaves any earlier enriched_data (such as
+                    # the processing limit note) in place, which must be retried
+                    if is_enriched(award):
+                        partial_file.write(dump_awards(award) + b'\n')
+                        partial_file.flush()
+                        os.fsync(partial_file.fileno())
             except KeyboardInterrupt:
-                print("\nProcess interrupted by user. Saving current progress...")
-                if enriched_awards:
-                    with open('bookawards_result_partial.json', 'w', encoding='utf-8') as f:
-                        json.dump(enriched_awards, f, indent=2, ensure_ascii=False)
-                    print(f"Progress saved with {len(enriched_awards)} processed awards")
+                print("\nProcess interrupted by user.")
+                executor.shutdown(wait=False, cancel_futures=True)
+                print(f"Progress saved in {PARTIAL_RESULTS_FILE}, rerun to resume")
                 raise
-            except Exception as e:
-                print(f"Error processing {award['award_name']}: {str(e)}")
-                continue
+        executor.shutdown()
 
-        # Add remaining awards without enrichment if we limited the processing
+        # Mark remaining awards as not enriched if we limited the processing
         if limit and limit < len(self.awards):
             for award in self.awards[limit:]:
-                award_copy = award.copy()
-                award_copy['enriched_data'] = {"note": "Data not enriched due to processing limit"}
-                enriched_awards.append(award_copy)
+                award.enriched_data = {"note": "Data not enriched due to processing limit"}
 
-        return enriched_awards
+        return self.awards
 
-    def save_enriched_awards(self, output_file: str = 'bookawards_result.json', limit: int = None):
+    def _load_partial_results(self) -> Dict[str, Award]:
+        """Read enriched awards saved by an interrupted run, keyed by award name."""
+        resumed = {}
+        try:
+            with open(PARTIAL_RESULTS_FILE, 'rb') as f:
+                for line in f:
+                    try:
+                        award = Award.from_dict(orjson.loads(line))
+                    except (orjson.JSONDecodeError, TypeError, KeyError):
+                        # A run killed mid-write can leave a truncated last line
+                        continue
+                    resumed[award.award_name] = award
+        except FileNotFoundError:
+            pass
+        return resumed
+
+    def save_enriched_awards(self, output_file: str = 'bookawards_result.json', limit: int = None,
+                             concurrency: int = DEFAULT_CONCURRENCY):
         """Save enriched awards data to a new JSON file.
         
         Args:
             output_file: Path to the output JSON file
             limit: Maximum number of awards to enrich (None for all)
+            concurrency: Maximum number of Perplexity requests in flight
         """
-        enriched_awards = self.enrich_awards_with_perplexity(limit=limit)
+        enriched_awards = self.enrich_awards_with_perplexity(limit=limit, concurrency=concurrency)
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(enriched_awards, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                write_awards(f, enriched_awards)
             print(f"Successfully saved enriched awards data to {output_file}")
+            # The run is complete, so the resume file is no longer needed
+            if os.path.exists(PARTIAL_RESULTS_FILE):
+                os.remove(PARTIAL_RESULTS_FILE)
         except Exception as e:
             print(f"Error saving enriched awards: {str(e)}")
 
-    def get_award_by_name(self, name: str) -> Dict:
-        """Get a specific award entry by name."""
-        for award in self.awards:
-            if award.get('award_name', '').lower() == name.lower():
-                return award
-        return {}
+    def get_award_by_name(self, name: str) -> Optional[Award]:
+        """Get a specific award entry by name, or None if there is no such award."""
+        return self._by_name_lower.get(name.lower())
 
-    def get_awards_by_category(self, category: str) -> List[Dict]:
+    def get_awards_by_category(self, category: str) -> List[Award]:
         """Get all awards that include a specific category."""
-        matching_awards = []
-        for award in self.awards:
-            if category in award.get('categories', []):
-                matching_awards.append(award)
-        return matching_awards
+        return list(self._by_category.get(category, []))
 
     def get_all_categories(self) -> List[str]:
         """Get a list of all unique categories across all awards."""
-        categories = set()
-        for award in self.awards:
-            categories.update(award.get('categories', []))
-        return sorted(list(categories))
+        return list(self._all_categories_sorted)
 
-    def get_awards_by_organization(self, organization: str) -> List[Dict]:
+    def get_awards_by_organization(self, organization: str) -> List[Award]:
         """Get all awards associated with a specific organization."""
-        return [award for award in self.awards 
-                if award.get('organization', '').lower() == organization.lower()]
+        return list(self._by_org_lower.get(organization.lower(), []))
 
 # Command line argument handling and documentation
 def parse_arguments():
@@ -247,6 +471,8 @@ def parse_arguments():
         Parsed arguments object with the following attributes:
         - limit: Maximum number of awards to enrich with Perplexity (None for all)
         - output: Path to the output JSON file
+        - concurrency: Maximum number of concurrent Perplexity requests
+        - no_cache: Ignore cached Perplexity responses and query the API again
         - help: Display help documentation
     """
     parser = argparse.ArgumentParser(
@@ -284,6 +510,20 @@ def parse_arguments():
         help='Path to the output JSON file (default: bookawards_result.json)'
     )
     
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Maximum number of concurrent Perplexity API requests (default: {DEFAULT_CONCURRENCY})\n'
+             'Lower this value if you run into Perplexity rate limits'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Ignore cached Perplexity responses in {CACHE_DIR}/ and query the API again'
+    )
+    
     return parser.parse_args()
 
 # Example usage
@@ -292,11 +532,16 @@ if __name__ == '__main__':
     args = parse_arguments()
     
     # Initialize scraper with input file and load awards
-    scraper = BookawardScraper(json_file=args.input)
+    scraper = BookawardScraper(json_file=args.input, use_cache=not args.no_cache)
     awards = scraper.load_awards()
     
     print(f"Total number of awards: {len(awards)}")
     
+    # Never replace an existing results file with an empty list
+    if not awards:
+        print(f"No awards loaded from {args.input}, leaving {args.output} untouched")
+        sys.exit(1)
+    
     # Handle different limit scenarios
     if args.limit is None:
         process_limit = None
@@ -309,20 +554,21 @@ if __name__ == '__main__':
         print(f"Limiting Perplexity API requests to the first {args.limit} awards")
     
     # Enrich awards with Perplexity API data and save to specified output file
-    scraper.save_enriched_awards(output_file=args.output, limit=process_limit)
+    scraper.save_enriched_awards(output_file=args.output, limit=process_limit,
+                                 concurrency=args.concurrency)
 
     print("\nExample - First 3 enriched book awards:")
     for i, award in enumerate(scraper.awards[:3], 1):
-        print(f"\n{i}. {award['award_name']}")
-        print(f"   Organization: {award.get('organization', 'Not specified')}")
-        print(f"   Categories: {', '.join(award.get('categories', ['None']))}")
+        print(f"\n{i}. {award.award_name}")
+        print(f"   Organization: {award.organization or 'Not specified'}")
+        print(f"   Categories: {', '.join(award.categories or ['None'])}")
         
         # Show enriched data if available
-        if 'enriched_data' in award and isinstance(award['enriched_data'], dict):
-            print(f"   Latest submission date: {award['enriched_data'].get('latestDateOfSubmission', 'Not available')}")
+        if isinstance(award.enriched_data, dict):
+            print(f"   Latest submission date: {award.enriched_data.get('latestDateOfSubmission', 'Not available')}")
             
             # Show potential competition if available
-            competition = award['enriched_data'].get('possibleStrongestCompetitionThisYear', [])
+            competition = award.enriched_data.get('possibleStrongestCompetitionThisYear', [])
             if competition and len(competition) > 0:
                 print(f"   Top competitor: {competition[0].get('author', 'Unknown')}: {competition[0].get('title', 'Unknown')}")
 
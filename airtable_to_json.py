@@ -1,9 +1,17 @@
 import os
 from pyairtable import Api
-import json
+import orjson
 from typing import List, Dict
 from datetime import datetime
 
+# (output key, Airtable field, default factory) for each field of an award entry
+_RECORD_FIELDS = (
+    ("award_name", "Award Name", str),
+    ("registration_url", "Registration URL", str),
+    ("categories", "Categories", list),
+    ("organization", "Organization", str),
+)
+
 class AirtableToJson:
     def __init__(self, api_key: str, base_id: str, table_id: str):
         self.api = Api(api_key)
@@ -22,22 +30,16 @@ class AirtableToJson:
 
     def transform_records(self, records: List[Dict]) -> List[Dict]:
         """Transform Airtable records into the desired JSON format."""
-        transformed_records = []
-        for record in records:
-            award_entry = {
-                "award_name": record.get("Award Name", ""),
-                "registration_url": record.get("Registration URL", ""),
-                "categories": record.get("Categories", []),
-                "organization": record.get("Organization", "")
-            }
-            transformed_records.append(award_entry)
-        return transformed_records
+        return [
+            {key: record[field] if field in record else default() for key, field, default in _RECORD_FIELDS}
+            for record in records
+        ]
 
     def save_to_json(self, data: List[Dict], output_file: str = "bookawards.json"):
         """Save the transformed records to a JSON file."""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"Successfully saved data to {output_file}")
         except Exception as e:
             print(f"Error saving to JSON: {str(e)}")
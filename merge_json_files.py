@@ -1,15 +1,33 @@
-import json
+import os
+import re
+import mmap
+import operator
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
+# Files at least this large are parsed straight from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def normalize_award_name(name: str) -> str:
+    """Return a case- and whitespace-insensitive key for an award name."""
+    return _WHITESPACE_RE.sub(' ', name).strip().casefold()
+
 def load_json_file(file_path: str) -> List[Dict]:
     """Load JSON file and return its contents."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as buffer:
+                    return orjson.loads(buffer)
     except FileNotFoundError:
         print(f"Error: {file_path} not found")
         return []
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Error: {file_path} contains invalid JSON")
         return []
 
@@ -23,28 +41,39 @@ def convert_name_to_award_dict(name: str) -> Dict:
     }
 
 def merge_awards(detailed_awards: List[Dict], award_names: List[str]) -> List[Dict]:
-    """Merge detailed awards with award names list."""
+    """Merge detailed awards with award names list.
+    
+    Awards are matched case-insensitively with collapsed whitespace. A
+    detailed entry always wins over a name-only entry for the same award.
+    """
     merged = {}
     
     # First, add all detailed awards
     for award in detailed_awards:
-        name = award['award_name'].strip()
-        merged[name] = award
+        key = normalize_award_name(award['award_name'])
+        if key in merged:
+            print(f"Duplicate award '{award['award_name']}' replaces '{merged[key]['award_name']}'")
+        merged[key] = award
     
     # Then, add any missing awards from the names list
     for name in award_names:
         name = name.strip()
-        if name and name not in merged:
-            merged[name] = convert_name_to_award_dict(name)
+        if not name:
+            continue
+        key = normalize_award_name(name)
+        if key not in merged:
+            merged[key] = convert_name_to_award_dict(name)
+        elif merged[key]['award_name'].strip() != name:
+            print(f"Award '{name}' merged into '{merged[key]['award_name']}'")
 
     # Convert back to list and sort by award name
-    return sorted(merged.values(), key=lambda x: x['award_name'])
+    return sorted(merged.values(), key=operator.itemgetter('award_name'))
 
 def save_json_file(data: List[Dict], output_file: str):
     """Save data to a JSON file with proper formatting."""
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         print(f"Successfully saved merged data to {output_file}")
     except Exception as e:
         print(f"Error saving to JSON: {str(e)}")
@@ -55,9 +84,11 @@ def main():
     file2 = 'bookawards_airtable_manual.json'
     output_file = 'bookawards_merged.json'
 
-    # Load both JSON files
-    awards1 = load_json_file(file1)
-    awards2 = load_json_file(file2)
+    # Load both JSON files; the reads are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(load_json_file, file1)
+        future2 = executor.submit(load_json_file, file2)
+        awards1, awards2 = future1.result(), future2.result()
 
     if not awards1 or not awards2:
         print("Error: Could not proceed with merge due to missing or invalid input files")
@@ -1,6 +1,5 @@
 import requests
 import os
-from rich import print
 from rich.console import Console
 from rich.markdown import Markdown
 from dotenv import load_dotenv
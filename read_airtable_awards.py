@@ -8,12 +8,34 @@ or passed as a command-line argument.
 """
 
 import os
+import re
 import sys
 import argparse
-import json
-import requests
-from typing import List, Dict, Any, Optional
-from dotenv import load_dotenv
+import hashlib
+import tempfile
+import functools
+import orjson
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# requests and dotenv are imported where they are used, so that --help and
+# argument errors do not pay for loading them
+if TYPE_CHECKING:
+    import requests
+
+# Directory holding Airtable pages together with the ETag they were served with
+CACHE_DIR = '.airtable_cache'
+# (connect, read) timeout in seconds for each page request
+PAGE_TIMEOUT = (3.05, 30)
+
+# Comma separator including the whitespace around it
+_CATEGORY_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
+class Award(NamedTuple):
+    """An award read from Airtable, saved as a JSON object with the same keys"""
+    name: str
+    categories: Tuple[str, ...]
+    record_id: str
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -67,6 +89,24 @@ def parse_arguments() -> argparse.Namespace:
         help='Output file path for the JSON file (default: airtable_awards.json)'
     )
     
+    parser.add_argument(
+        '--ndjson',
+        action='store_true',
+        help='Write one compact JSON object per award per line (NDJSON) instead of an indented JSON object'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Ignore cached Airtable pages in {CACHE_DIR}/ and download every page again'
+    )
+    
+    parser.add_argument(
+        '--list', '-l',
+        action='store_true',
+        help='Print every award with its categories after saving'
+    )
+    
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -76,6 +116,14 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env_api_key() -> Optional[str]:
+    """Load the .env file once per process and return AIRTABLE_API_KEY"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return os.getenv('AIRTABLE_API_KEY')
+
+
 def get_api_key(args: argparse.Namespace) -> str:
     """Get API key from args or environment variables
     
@@ -93,8 +141,7 @@ def get_api_key(args: argparse.Namespace) -> str:
         return args.api_key
     
     # Second priority: .env file
-    load_dotenv()
-    env_key = os.getenv('AIRTABLE_API_KEY')
+    env_key = _load_env_api_key()
     if env_key:
         return env_key
     
@@ -102,7 +149,132 @@ def get_api_key(args: argparse.Namespace) -> str:
     raise ValueError("No Airtable API key provided. Please set AIRTABLE_API_KEY in .env file or use --api-key")
 
 
-def read_airtable_award_names(api_key: str, base_id: str, table_name: str, field_name: str, category_field: str, verbose: bool = True) -> Dict[str, Dict[str, Any]]:
+def create_session(api_key: str) -> 'requests.Session':
+    """Create a pooled HTTP session that sends the Airtable credentials by default
+    
+    The session keeps connections alive between requests and retries rate
+    limits and server errors with exponential backoff.
+    
+    Args:
+        api_key: Airtable API key
+        
+    Returns:
+        requests.Session: Session with the Authorization header set
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import make_headers
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {api_key}",
+        # Only advertises codings urllib3 can decode (br needs brotli installed)
+        "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"]
+    })
+    # Airtable sends Retry-After with its 429s; urllib3 sleeps for that long
+    # instead of the backoff delay when respect_retry_after_header is set
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET'],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+
+def _page_cache_path(base_id: str, table_name: str) -> str:
+    """Return the cache file for the first page of a table"""
+    key = hashlib.sha256(f"{base_id}\0{table_name}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def _load_cached_page(path: str) -> Optional[Dict[str, Any]]:
+    """Return a cached page entry with 'etag' and 'page' keys, or None on a miss"""
+    try:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _store_cached_page(path: str, etag: str, page: Dict[str, Any]) -> None:
+    """Atomically write a page and its ETag to the cache"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps({"etag": etag, "page": page}))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _norm_cats(cat_data: Any) -> Tuple[str, ...]:
+    """Normalize an Airtable categories value to a tuple of category names"""
+    if cat_data is None:
+        return ()
+    # Categories might be a string or a list in Airtable; JSON decoding only
+    # produces exact list/str types, so skip isinstance's subclass checks
+    cat_type = type(cat_data)
+    if cat_type is list:
+        return tuple(cat_data)
+    if cat_type is str:
+        if ',' not in cat_data:
+            return (cat_data.strip(),)
+        return tuple(_CATEGORY_SPLIT_RE.split(cat_data.strip()))
+    return ()
+
+
+def _make_extractor(field_name: str, category_field: Optional[str]) -> Callable[[List[Dict[str, Any]], Dict[str, Award]], None]:
+    """Build a page extractor specialized for one field_name/category_field pair
+    
+    The field names are fixed for a whole run, so they are bound once as
+    closure cells instead of being passed through every page call. A table
+    read without a category field gets a loop with no category lookup at all.
+    
+    Args:
+        field_name: Name of the field containing award names
+        category_field: Name of the field containing award categories, or None
+        
+    Returns:
+        Function adding the awards found in one page of records to awards_data
+    """
+    norm_cats = _norm_cats
+    award = Award
+    no_cats = ()
+    
+    if category_field:
+        def extract(records: List[Dict[str, Any]], awards_data: Dict[str, Award]) -> None:
+            put = awards_data.__setitem__
+            for record in records:
+                fields = record.get('fields')
+                if not fields:
+                    continue
+                award_name = fields.get(field_name)
+                if award_name is None:
+                    continue
+                put(award_name, award(award_name, norm_cats(fields.get(category_field)), record.get('id') or ''))
+    else:
+        def extract(records: List[Dict[str, Any]], awards_data: Dict[str, Award]) -> None:
+            put = awards_data.__setitem__
+            for record in records:
+                fields = record.get('fields')
+                if not fields:
+                    continue
+                award_name = fields.get(field_name)
+                if award_name is None:
+                    continue
+                put(award_name, award(award_name, no_cats, record.get('id') or ''))
+    
+    return extract
+
+
+def read_airtable_award_names(api_key: str, base_id: str, table_name: str, field_name: str, category_field: Optional[str] = None, verbose: bool = True, use_cache: bool = True, session: Optional['requests.Session'] = None) -> Dict[str, Award]:
     """
 Read award names from Airtable, handling pagination to get all records
     
@@ -111,18 +283,28 @@ Read award names from Airtable, handling pagination to get all records
         base_id: Airtable base ID
         table_name: Name of the table to read from
         field_name: Name of the field containing award names
+        category_field: Name of the field containing award categories, or
+            None to skip categories (every award gets no categories)
         verbose: Whether to print status messages
-        
+        use_cache: Whether to revalidate pages cached in CACHE_DIR by ETag
+        session: Session from create_session to reuse; a new one is created
+            and closed when omitted
+
     Returns:
-        List[str]: List of award names
+        Dict[str, Award]: Awards keyed by award name
     """
+    import requests
+    
     base_url = f"https://api.airtable.com/v0/{base_id}/{table_name}"
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
     
-    all_records = []
+    # One session keeps the TLS connection to Airtable alive across all pages
+    owns_session = session is None
+    if owns_session:
+        session = create_session(api_key)
+    
+    awards_data = {}
+    extract_awards = _make_extractor(field_name, category_field)
+    record_count = 0
     offset = None
     page_count = 0
     
@@ -138,48 +320,52 @@ Read award names from Airtable, handling pagination to get all records
             if offset:
                 params['offset'] = offset
             
+            # Only a table that fits in its first page is cached: later pages are
+            # reached through offset cursors that belong to one listing and
+            # expire, so a cached page with an offset could not be continued.
+            # Ask Airtable to confirm such a page instead of sending it again.
+            cached = None
+            if offset is None:
+                cache_path = _page_cache_path(base_id, table_name)
+                cached = _load_cached_page(cache_path) if use_cache else None
+            request_headers = {}
+            if cached:
+                request_headers['If-None-Match'] = cached['etag']
+            
             # Make the API request
-            response = requests.get(base_url, headers=headers, params=params, timeout=15)
+            response = session.get(base_url, params=params, headers=request_headers, timeout=PAGE_TIMEOUT)
             
-            if response.status_code != 200:
+            if cached and response.status_code == 304:
+                data = cached['page']
+            elif response.status_code != 200:
                 if verbose:
                     print(f"Error: HTTP {response.status_code}")
                     print(response.text)
                 return {}
-            
-            data = response.json()
+            else:
+                data = orjson.loads(response.content)
+                if verbose and 'Content-Encoding' in response.headers and 'Content-Length' in response.headers:
+                    print(f"  {len(response.content) / 1024:.1f} KB received as "
+                          f"{int(response.headers['Content-Length']) / 1024:.1f} KB "
+                          f"{response.headers['Content-Encoding']}")
+                etag = response.headers.get('ETag')
+                if etag and offset is None and not data.get('offset'):
+                    _store_cached_page(cache_path, etag, data)
             page_records = data.get('records', [])
-            all_records.extend(page_records)
+            record_count += len(page_records)
+            
+            # Extract award names and categories before fetching the next page,
+            # so only one page of raw records is held in memory at a time
+            extract_awards(page_records, awards_data)
             
             # Check if there are more records to fetch
             offset = data.get('offset')
+            del data, page_records
             if not offset:
                 break
         
-        # Extract award names and categories from all records
-        awards_data = {}
-        for record in all_records:
-            if 'fields' in record and field_name in record['fields']:
-                award_name = record['fields'][field_name]
-                
-                # Get categories if available
-                categories = []
-                if category_field in record['fields']:
-                    # Categories might be a string or a list in Airtable
-                    cat_data = record['fields'][category_field]
-                    if isinstance(cat_data, list):
-                        categories = cat_data
-                    elif isinstance(cat_data, str):
-                        categories = [cat.strip() for cat in cat_data.split(',')]
-                    
-                awards_data[award_name] = {
-                    "name": award_name,
-                    "categories": categories,
-                    "record_id": record.get('id', '')
-                }
-        
         if verbose:
-            print(f"Successfully read {len(awards_data)} awards from Airtable (from {len(all_records)} total records)")
+            print(f"Successfully read {len(awards_data)} awards from Airtable (from {record_count} total records)")
         return awards_data
     
     except requests.exceptions.Timeout:
@@ -194,22 +380,53 @@ Read award names from Airtable, handling pagination to get all records
         if verbose:
             print(f"Error reading from Airtable: {str(e)}")
         return {}
+    finally:
+        if owns_session:
+            session.close()
 
 
-def save_to_json(data: Dict[str, Dict[str, Any]], output_file: str, verbose: bool = True) -> bool:
+def save_to_json(data: Dict[str, Award], output_file: str, verbose: bool = True, ndjson: bool = False) -> bool:
     """Save data to JSON file
     
     Args:
         data: Award data dictionary to save
         output_file: Path to output file
         verbose: Whether to print status messages
+        ndjson: Write one compact award object per line instead of an
+            indented JSON object keyed by award name
         
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson hands NamedTuples to default, which writes them as objects
+        if ndjson:
+            blob = b''.join([orjson.dumps(award, default=Award._asdict) + b'\n' for award in data.values()])
+        else:
+            blob = orjson.dumps(data, default=Award._asdict, option=orjson.OPT_INDENT_2)
+        
+        # Leave the file untouched when it already holds these exact bytes.
+        # The sidecar pairs the digest with the size and mtime the output had
+        # when it was written, so an output edited or restored since then is
+        # rewritten even though the digest still matches.
+        digest = hashlib.blake2b(blob, digest_size=16).hexdigest()
+        digest_file = output_file + '.blake2'
+        try:
+            stat = os.stat(output_file)
+            with open(digest_file, 'r') as f:
+                previous = f.read().split()
+        except OSError:
+            previous = None
+        if previous and previous == [digest, str(stat.st_size), str(stat.st_mtime_ns)]:
+            if verbose:
+                print(f"{output_file} unchanged, skipping write")
+            return True
+        
+        with open(output_file, 'wb') as f:
+            f.write(blob)
+        stat = os.stat(output_file)
+        with open(digest_file, 'w') as f:
+            f.write(f"{digest} {stat.st_size} {stat.st_mtime_ns}")
         if verbose:
             print(f"Successfully saved data to {output_file}")
         return True
@@ -219,26 +436,28 @@ def save_to_json(data: Dict[str, Dict[str, Any]], output_file: str, verbose: boo
         return False
 
 
-def list_available_bases(api_key: str, verbose: bool = True) -> List[Dict[str, str]]:
+def list_available_bases(api_key: str, verbose: bool = True, session: Optional['requests.Session'] = None) -> List[Dict[str, str]]:
     """List available bases to verify API connection
     
     Args:
         api_key: Airtable API key
         verbose: Whether to print status messages
+        session: Session from create_session to reuse; a new one is created
+            and closed when omitted
         
     Returns:
         List[Dict[str, str]]: List of bases with name and ID
     """
     url = "https://api.airtable.com/v0/meta/bases"
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        if session is None:
+            with create_session(api_key) as own_session:
+                response = own_session.get(url, timeout=10)
+        else:
+            response = session.get(url, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             bases = []
             for base in data.get('bases', []):
                 bases.append({
@@ -288,14 +507,17 @@ def main():
     if verbose:
         print(f"\nAttempting to read from base: {args.base_id}")
     
-    awards_data = read_airtable_award_names(
-        api_key=api_key,
-        base_id=args.base_id,
-        table_name=args.table_name,
-        field_name=args.field_name,
-        category_field=args.category_field,
-        verbose=verbose
-    )
+    with create_session(api_key) as session:
+        awards_data = read_airtable_award_names(
+            api_key=api_key,
+            base_id=args.base_id,
+            table_name=args.table_name,
+            field_name=args.field_name,
+            category_field=args.category_field,
+            verbose=verbose,
+            use_cache=not args.no_cache,
+            session=session
+        )
     
     # If failed, provide a simple error message without interactive troubleshooting
     if not awards_data and verbose:
@@ -308,22 +530,21 @@ def main():
     
     # Save results if we have any
     if awards_data:
-        success = save_to_json(awards_data, args.output, verbose=verbose)
+        success = save_to_json(awards_data, args.output, verbose=verbose, ndjson=args.ndjson)
         if not success:
             sys.exit(1)
             
         if verbose:
             print(f"Total awards found: {len(awards_data)}")
-            # Print all award names with their categories
-            if awards_data:
-                print("\nAll awards with categories:")
-                for i, (award_name, award_info) in enumerate(awards_data.items()):
-                    categories = award_info.get('categories', [])
-                    if categories:
-                        category_text = ", ".join(categories)
-                        print(f"  {i+1}. {award_name} - Categories: {category_text}")
-                    else:
-                        print(f"  {i+1}. {award_name} - No categories found")
+        
+        # Print all award names with their categories in a single write
+        if args.list:
+            lines = [
+                f"  {i}. {award_name} - Categories: {', '.join(award_info.categories)}"
+                if award_info.categories else f"  {i}. {award_name} - No categories found"
+                for i, (award_name, award_info) in enumerate(awards_data.items(), 1)
+            ]
+            sys.stdout.write("\nAll awards with categories:\n" + "\n".join(lines) + "\n")
     elif verbose:
         print("\nNo award data was retrieved. Please check your Airtable credentials and base information.")
         sys.exit(1)
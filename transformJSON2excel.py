@@ -1,9 +1,36 @@
-import json
 import argparse
-import os
+import sys
+import orjson
+from operator import itemgetter
+from pathlib import Path
+from zipfile import ZipFile, ZIP_DEFLATED
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.dimensions import ColumnDimension
+from openpyxl.writer.excel import ExcelWriter
+
+
+# Header row of each sheet
+OVERVIEW_HEADERS = [
+    "Award Name", "Organization", "Registration URL", "Categories",
+    "Latest Submission Date", "Enriched Organization", "Enriched Categories", "Enriched Registration URL"
+]
+WINNING_BOOKS_HEADERS = ["Award Name", "Author", "Title", "Publishing Year", "Publisher", "ISBN", "Link"]
+COMPETITION_HEADERS = ["Award Name", "Author", "Title"]
+CATEGORIES_HEADERS = ["Award Name", "Category"]
+
+# Header cell styles, shared by every header cell of every sheet
+HEADER_FONT = Font(name='Arial', size=12, bold=True, color='FFFFFF')
+HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+# Deflate level for the xlsx archive; openpyxl uses zlib's default of 6, while
+# level 1 compresses several times faster for a slightly larger file
+ZIP_COMPRESSLEVEL = 1
+
+# Value the enrichment step uses for fields it could not find
+NOT_AVAILABLE = 'Not Available'
 
 
 def parse_arguments():
@@ -28,271 +55,244 @@ def parse_arguments():
         help='Path to the output Excel file (default: bookawards.xlsx)'
     )
     
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Suppress verbose output'
+    )
+    
     return parser.parse_args()
 
 
-def load_json_data(json_file):
+def load_json_data(json_file, verbose=True):
     """
-    Load JSON data from a file
+    Load JSON data from a file, printing status messages when verbose
     """
     try:
-        with open(json_file, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        print(f"Successfully loaded data from {json_file}")
-        print(f"Total awards: {len(data)}")
+        # orjson parses the raw bytes directly, skipping a separate decode step
+        with open(json_file, 'rb') as file:
+            data = orjson.loads(file.read())
+        if verbose:
+            print(f"Successfully loaded data from {json_file}")
+            print(f"Total awards: {len(data)}")
         return data
     except Exception as e:
-        print(f"Error loading JSON data: {str(e)}")
+        if verbose:
+            print(f"Error loading JSON data: {str(e)}")
         return None
 
 
 def apply_header_style(sheet, headers):
     """
-    Apply styling to the header row
+    Build the styled header row for a write-only sheet
     """
-    # Add headers
-    for col_idx, header in enumerate(headers, 1):
-        cell = sheet.cell(row=1, column=col_idx, value=header)
-        cell.font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
-        cell.fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    header_row = []
+    for header in headers:
+        cell = WriteOnlyCell(sheet, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = HEADER_ALIGNMENT
+        header_row.append(cell)
+    return header_row
 
 
-def create_awards_overview_sheet(workbook, data):
+def write_sheet(workbook, title, headers, rows, width=20, empty_label=None, verbose=True):
     """
-    Create a sheet with award overview information
+    Create a sheet and write the styled header row followed by all data rows
+    
+    When there are no rows and empty_label is given, a placeholder row is
+    written instead and, when verbose, a warning mentioning empty_label is
+    printed.
     """
-    sheet = workbook.create_sheet(title="Awards Overview")
+    sheet = workbook.create_sheet(title=title)
     
-    # Define headers
-    headers = [
-        "Award Name", "Organization", "Registration URL", "Categories",
-        "Latest Submission Date", "Enriched Organization", "Enriched Categories", "Enriched Registration URL"
-    ]
+    # Column widths must be set before the first row is written; a single
+    # dimension spanning every header column covers them all
+    sheet.column_dimensions['A'] = ColumnDimension(sheet, min=1, max=len(headers), width=width)
     
     # Apply styling to header row
-    apply_header_style(sheet, headers)
+    sheet.append(apply_header_style(sheet, headers))
     
     # Add data rows
-    row_idx = 2
-    for award in data:
-        # Basic data
-        sheet.cell(row=row_idx, column=1, value=award.get('award_name', ''))
-        sheet.cell(row=row_idx, column=2, value=award.get('organization', ''))
-        sheet.cell(row=row_idx, column=3, value=award.get('registration_url', ''))
-        
-        # Make sure categories is a list before joining
-        categories = award.get('categories', [])
-        if categories and isinstance(categories, list):
-            sheet.cell(row=row_idx, column=4, value=', '.join(categories))
-        else:
-            sheet.cell(row=row_idx, column=4, value='')
-        
-        # Enriched data (if available)
-        if 'enriched_data' in award and isinstance(award['enriched_data'], dict):
-            enriched = award['enriched_data']
-            sheet.cell(row=row_idx, column=5, value=enriched.get('latestDateOfSubmission', ''))
-            sheet.cell(row=row_idx, column=6, value=enriched.get('organization', ''))
-            
-            # Make sure categories is a list before joining
-            enriched_categories = enriched.get('categories', [])
-            if enriched_categories and isinstance(enriched_categories, list):
-                sheet.cell(row=row_idx, column=7, value=', '.join(enriched_categories))
-            else:
-                sheet.cell(row=row_idx, column=7, value='')
-                
-            sheet.cell(row=row_idx, column=8, value=enriched.get('registrationUrl', ''))
-        
-        row_idx += 1
+    for row in rows:
+        sheet.append(row)
     
-    # Auto-adjust column widths
-    for col_idx, _ in enumerate(headers, 1):
-        sheet.column_dimensions[get_column_letter(col_idx)].width = 20
+    # If no rows were found, add a placeholder row
+    if not rows and empty_label:
+        sheet.append(["No data available"])
+        if verbose:
+            print(f"Warning: No {empty_label} data available, creating empty sheet")
     
-    print(f"Created 'Awards Overview' sheet with {row_idx-2} rows")
+    if verbose:
+        print(f"Created '{title}' sheet with {len(rows)} rows")
 
 
-def create_winning_books_sheet(workbook, data):
+def _list_or_empty(value):
     """
-    Create a sheet with winning books information
+    Return value if it is a list, otherwise an empty list
     """
-    sheet = workbook.create_sheet(title="Winning Books")
-    
-    # Define headers
-    headers = [
-        "Award Name", "Author", "Title", "Publishing Year", "Publisher", "ISBN", "Link"
-    ]
-    
-    # Apply styling to header row
-    apply_header_style(sheet, headers)
-    
-    # Add data rows
-    row_idx = 2
-    book_count = 0
+    return value if isinstance(value, list) else []
+
+
+def normalize_awards(data):
+    """
+    Return a cleaned copy of the awards with every field collect_rows reads
     
+    Each award gets list-typed categories and an enriched_data dict with
+    list-typed categories, winning books and competitors (the latter two
+    holding only dicts), or None when the award was not enriched. Keys that
+    are missing get the same '' default the sheets showed before.
+    """
+    awards = []
     for award in data:
-        award_name = award.get('award_name', '')
+        enriched = award.get('enriched_data')
+        if isinstance(enriched, dict):
+            enriched = {
+                'latestDateOfSubmission': enriched.get('latestDateOfSubmission', ''),
+                'organization': enriched.get('organization', ''),
+                'categories': _list_or_empty(enriched.get('categories')),
+                'registrationUrl': enriched.get('registrationUrl', ''),
+                'lastWinningBooks': [
+                    book for book in _list_or_empty(enriched.get('lastWinningBooks'))
+                    if isinstance(book, dict)
+                ],
+                'possibleStrongestCompetitionThisYear': [
+                    competitor for competitor in _list_or_empty(enriched.get('possibleStrongestCompetitionThisYear'))
+                    if isinstance(competitor, dict)
+                ]
+            }
+        else:
+            enriched = None
         
-        if 'enriched_data' in award and isinstance(award['enriched_data'], dict):
-            books = award['enriched_data'].get('lastWinningBooks', [])
-            
-            # Check if books is an iterable
-            if books and isinstance(books, list):
-                for book in books:
-                    if isinstance(book, dict) and book and not all(val == 'Not Available' for val in book.values()):
-                        sheet.cell(row=row_idx, column=1, value=award_name)
-                        sheet.cell(row=row_idx, column=2, value=book.get('author', ''))
-                        sheet.cell(row=row_idx, column=3, value=book.get('title', ''))
-                        sheet.cell(row=row_idx, column=4, value=book.get('publishingYear', ''))
-                        sheet.cell(row=row_idx, column=5, value=book.get('publisher', ''))
-                        sheet.cell(row=row_idx, column=6, value=book.get('isbn', ''))
-                        sheet.cell(row=row_idx, column=7, value=book.get('link', ''))
-                        
-                        row_idx += 1
-                        book_count += 1
-    
-    # If no books were found, add a placeholder row
-    if book_count == 0:
-        sheet.cell(row=2, column=1, value="No data available")
-        print("Warning: No winning books data available, creating empty sheet")
-    
-    # Auto-adjust column widths
-    for col_idx, _ in enumerate(headers, 1):
-        sheet.column_dimensions[get_column_letter(col_idx)].width = 20
-    
-    print(f"Created 'Winning Books' sheet with {book_count} rows")
+        awards.append({
+            'award_name': award.get('award_name', ''),
+            'organization': award.get('organization', ''),
+            'registration_url': award.get('registration_url', ''),
+            'categories': _list_or_empty(award.get('categories')),
+            'enriched_data': enriched
+        })
+    return awards
 
 
-def create_competition_sheet(workbook, data):
-    """
-    Create a sheet with competition information
+# Field readers for normalized awards, which always hold these keys
+_award_fields = itemgetter('award_name', 'organization', 'registration_url', 'categories', 'enriched_data')
+_enriched_fields = itemgetter('latestDateOfSubmission', 'organization', 'categories', 'registrationUrl',
+                              'lastWinningBooks', 'possibleStrongestCompetitionThisYear')
+
+
+def collect_rows(data):
     """
-    sheet = workbook.create_sheet(title="Competition")
-    
-    # Define headers
-    headers = ["Award Name", "Author", "Title"]
+    Build the rows of all four sheets in a single pass over the awards
     
-    # Apply styling to header row
-    apply_header_style(sheet, headers)
+    Args:
+        data: Awards as returned by normalize_awards
     
-    # Add data rows
-    row_idx = 2
-    competition_count = 0
+    Returns:
+        tuple: (overview_rows, winning_books_rows, competition_rows, categories_rows)
+    """
+    overview_rows = []
+    winning_books_rows = []
+    competition_rows = []
+    categories_rows = []
     
     for award in data:
-        award_name = award.get('award_name', '')
+        award_name, organization, registration_url, categories, enriched = _award_fields(award)
         
-        if 'enriched_data' in award and isinstance(award['enriched_data'], dict):
-            competitors = award['enriched_data'].get('possibleStrongestCompetitionThisYear', [])
+        # One row per category for the categories sheet
+        categories_rows.extend([[award_name, category] for category in categories])
+        
+        # Basic data
+        row = [award_name, organization, registration_url, ', '.join(categories)]
+        
+        # Enriched data (if available) feeds the overview row and the
+        # winning books and competition sheets
+        if enriched is not None:
+            (submission_date, enriched_organization, enriched_categories,
+             enriched_url, books, competitors) = _enriched_fields(enriched)
+            row += [submission_date, enriched_organization, ', '.join(enriched_categories), enriched_url]
             
-            # Ensure competitors is an iterable list
-            if competitors and isinstance(competitors, list):
-                for competitor in competitors:
-                    if isinstance(competitor, dict):
-                        sheet.cell(row=row_idx, column=1, value=award_name)
-                        sheet.cell(row=row_idx, column=2, value=competitor.get('author', ''))
-                        sheet.cell(row=row_idx, column=3, value=competitor.get('title', ''))
-                        
-                        row_idx += 1
-                        competition_count += 1
-    
-    # If no competition was found, add a placeholder row
-    if competition_count == 0:
-        sheet.cell(row=2, column=1, value="No data available")
-        print("Warning: No competition data available, creating empty sheet")
-    
-    # Auto-adjust column widths
-    for col_idx, _ in enumerate(headers, 1):
-        sheet.column_dimensions[get_column_letter(col_idx)].width = 20
+            winning_books_rows.extend([
+                [
+                    award_name,
+                    book.get('author', ''),
+                    book.get('title', ''),
+                    book.get('publishingYear', ''),
+                    book.get('publisher', ''),
+                    book.get('isbn', ''),
+                    book.get('link', '')
+                ]
+                for book in books
+                if any(val != NOT_AVAILABLE for val in book.values())
+            ])
+            competition_rows.extend([
+                [award_name, competitor.get('author', ''), competitor.get('title', '')]
+                for competitor in competitors
+            ])
+        
+        overview_rows.append(row)
     
-    print(f"Created 'Competition' sheet with {competition_count} rows")
+    return overview_rows, winning_books_rows, competition_rows, categories_rows
 
 
-def create_categories_sheet(workbook, data):
+def save_workbook(workbook, excel_file):
     """
-    Create a sheet with categories information
+    Save the workbook like Workbook.save, but with fast zip compression
     """
-    sheet = workbook.create_sheet(title="Categories")
-    
-    # Define headers
-    headers = ["Award Name", "Category"]
-    
-    # Apply styling to header row
-    apply_header_style(sheet, headers)
-    
-    # Add data rows
-    row_idx = 2
-    category_count = 0
-    
-    for award in data:
-        award_name = award.get('award_name', '')
-        categories = award.get('categories', [])
-        
-        # Ensure categories is an iterable list
-        if categories and isinstance(categories, list):
-            for category in categories:
-                sheet.cell(row=row_idx, column=1, value=award_name)
-                sheet.cell(row=row_idx, column=2, value=category)
-                
-                row_idx += 1
-                category_count += 1
-    
-    # If no categories were found, add a placeholder row
-    if category_count == 0:
-        sheet.cell(row=2, column=1, value="No data available")
-        print("Warning: No category data available, creating empty sheet")
-    
-    # Auto-adjust column widths
-    for col_idx, _ in enumerate(headers, 1):
-        sheet.column_dimensions[get_column_letter(col_idx)].width = 30
-    
-    print(f"Created 'Categories' sheet with {category_count} rows")
+    archive = ZipFile(excel_file, 'w', ZIP_DEFLATED, allowZip64=True, compresslevel=ZIP_COMPRESSLEVEL)
+    ExcelWriter(workbook, archive).save()
 
 
-def transform_json_to_excel(json_file, excel_file):
+def transform_json_to_excel(json_file, excel_file, verbose=True):
     """
-    Transform JSON data to Excel format
+    Transform JSON data to Excel format, printing progress when verbose
     """
     # Load JSON data
-    data = load_json_data(json_file)
+    data = load_json_data(json_file, verbose=verbose)
     if not data:
         return False
     
     try:
-        # Create a new workbook
-        workbook = Workbook()
+        # Create a write-only workbook, which streams rows to disk instead of
+        # keeping every cell in memory (it also starts without a default sheet)
+        workbook = Workbook(write_only=True)
         
-        # Remove the default sheet
-        default_sheet = workbook.active
-        workbook.remove(default_sheet)
+        # Collect the rows of every sheet in one pass over the cleaned awards
+        overview_rows, winning_books_rows, competition_rows, categories_rows = collect_rows(normalize_awards(data))
         
         # Create sheets with data
-        create_awards_overview_sheet(workbook, data)
-        create_winning_books_sheet(workbook, data)
-        create_competition_sheet(workbook, data)
-        create_categories_sheet(workbook, data)
-        
-        # Set the first sheet as active
-        workbook.active = 0
+        write_sheet(workbook, "Awards Overview", OVERVIEW_HEADERS, overview_rows, verbose=verbose)
+        write_sheet(workbook, "Winning Books", WINNING_BOOKS_HEADERS, winning_books_rows,
+                    empty_label="winning books", verbose=verbose)
+        write_sheet(workbook, "Competition", COMPETITION_HEADERS, competition_rows,
+                    empty_label="competition", verbose=verbose)
+        write_sheet(workbook, "Categories", CATEGORIES_HEADERS, categories_rows,
+                    width=30, empty_label="category", verbose=verbose)
         
         # Save the workbook
-        workbook.save(excel_file)
+        save_workbook(workbook, excel_file)
         
-        print(f"\nExcel file '{excel_file}' has been created successfully.")
+        if verbose:
+            print(f"\nExcel file '{excel_file}' has been created successfully.")
         return True
     
     except Exception as e:
-        print(f"Error creating Excel file: {str(e)}")
+        if verbose:
+            print(f"Error creating Excel file: {str(e)}")
         return False
 
 
 if __name__ == "__main__":
     # Parse command line arguments
     args = parse_arguments()
+    verbose = not args.quiet
     
     # Transform JSON to Excel
-    if transform_json_to_excel(args.input, args.output):
-        print(f"\nTransformation complete.")
-        print(f"Output file: {os.path.abspath(args.output)}")
+    if transform_json_to_excel(args.input, args.output, verbose=verbose):
+        if verbose:
+            output_path = Path(args.output).resolve()
+            print(f"\nTransformation complete.")
+            print(f"Output file: {output_path}")
     else:
-        print("\nTransformation failed.")
+        if verbose:
+            print("\nTransformation failed.")
+        sys.exit(1)